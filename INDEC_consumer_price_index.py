@@ -1,60 +1,137 @@
 import requests
+from requests.adapters import HTTPAdapter
+import numpy as np
 import pandas as pd
-from bs4 import BeautifulSoup
-from io import BytesIO
+import xlrd
+from xlrd.compdoc import CompDocError
+from bs4 import BeautifulSoup, SoupStrainer
+from concurrent.futures import ThreadPoolExecutor
 import re
+import os
+import hashlib
+import json
+import struct
+import functools
 
-def find_and_return_xls_link(page_url, reference_text=None):
+# Links to .xls files, and a filter so only anchors are parsed from the HTML
+_XLS_HREF_RE = re.compile(r"\.xls$", re.IGNORECASE)
+_ANCHORS_ONLY = SoupStrainer("a", href=True)
+
+# Signature at the start of every legacy .xls (OLE2 compound) file
+XLS_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+
+# Errors xlrd fails with on truncated or corrupt files, besides its own XLRDError
+_CORRUPT_WORKBOOK_ERRORS = (xlrd.XLRDError, CompDocError, struct.error, LookupError, AssertionError, ValueError)
+
+# Headers sent with every request
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.5735.110 Safari/537.36"
+}
+
+# Share one keep-alive connection pool across every request to indec.gob.ar
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+# Folder where parsed spreadsheets are kept between runs
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "indec_cpi")
+
+# Part of every cached file name, bump it whenever the parsed output changes
+PARSER_VERSION = 2
+
+# Validators (ETag / Last-Modified) of the last download of every URL
+DOWNLOAD_INDEX_PATH = os.path.join(os.path.expanduser("~"), ".cache", "indec_cpi.json")
+
+# Regions reported in the sheet
+VALID_REGIONS = frozenset({"GBA", "Pampeana", "Noreste", "Noroeste", "Cuyo", "Patagonia"})
+
+# Dictionary to convert months to numeric format
+MONTH_MAPPING = {
+    "Enero": "01", "Febrero": "02", "Marzo": "03", "Abril": "04",
+    "Mayo": "05", "Junio": "06", "Julio": "07", "Agosto": "08",
+    "Septiembre": "09", "Octubre": "10", "Noviembre": "11", "Diciembre": "12"
+}
+
+# Word of the year headers (like "Año 2017") and month names for every sheet language
+YEAR_WORDS = {"es": "año"}
+MONTH_MAPPINGS = {"es": MONTH_MAPPING}
+
+def fetch_page(page_url):
     """
-    Finds and returns the most relevant .xls file link from a webpage.
+    Downloads the HTML of a webpage.
 
     Parameters:
-        page_url (str): URL of the webpage to scrape for .xls links.
-        reference_text (str, optional): A keyword or phrase to prioritize a specific link.
+        page_url (str): URL of the webpage to download.
 
     Returns:
-        str or None: The URL of the .xls file if found, otherwise None.
+        bytes or None: HTML content of the page if successfully downloaded, otherwise None.
     """
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.5735.110 Safari/537.36"
-    }
-    session = requests.Session()
     try:
         # Send a GET request to the webpage
-        response = session.get(page_url, headers=headers)
+        response = _SESSION.get(page_url, headers=HEADERS, timeout=30)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, "html.parser")
-        
-        # Find all anchor tags with .xls links
-        links = soup.find_all("a", href=True)
-        xls_links = [link for link in links if link["href"].endswith(".xls")]
-        
-        # Return None if no links are found
-        if not xls_links:
-            return None
-        
-        # Prioritize links containing the reference text if provided
-        if reference_text:
-            for link in xls_links:
-                if reference_text.lower() in link.text.lower():
-                    result = link["href"]
-                    break
-            else:
-                result = xls_links[-1]["href"]  # Default to the last link
-        else:
-            result = xls_links[-1]["href"]
-            
-        # Ensure the link is an absolute URL
-        if not result.startswith("http"):
-            base_url = "/".join(page_url.split("/")[:3])
-            result = base_url + result
-
-        return result
+        return response.content
     except requests.exceptions.RequestException as e:
         #print(f"Error accessing the website: {e}")
         return None
 
 
+def extract_xls_link(page_content, page_url, reference_text=None):
+    """
+    Extracts the most relevant .xls file link from the HTML of a webpage.
+
+    Parameters:
+        page_content (bytes): HTML content of the webpage.
+        page_url (str): URL the HTML was downloaded from, used to resolve relative links.
+        reference_text (str, optional): A keyword or phrase to prioritize a specific link.
+
+    Returns:
+        str or None: The URL of the .xls file if found, otherwise None.
+    """
+    soup = BeautifulSoup(page_content, "lxml", parse_only=_ANCHORS_ONLY)
+    
+    # Find all anchor tags with .xls links
+    xls_links = soup.find_all("a", href=_XLS_HREF_RE)
+    
+    # Return None if no links are found
+    if not xls_links:
+        return None
+    
+    # Prioritize links containing the reference text if provided
+    if reference_text:
+        for link in xls_links:
+            if reference_text.lower() in link.text.lower():
+                result = link["href"]
+                break
+        else:
+            result = xls_links[-1]["href"]  # Default to the last link
+    else:
+        result = xls_links[-1]["href"]
+        
+    # Ensure the link is an absolute URL
+    if not result.startswith("http"):
+        base_url = "/".join(page_url.split("/")[:3])
+        result = base_url + result
+
+    return result
+
+
+def find_and_return_xls_link(page_url, reference_text=None):
+    """
+    Finds and returns the most relevant .xls file link from a webpage.
+
+    Parameters:
+        page_url (str): URL of the webpage to scrape for .xls links.
+        reference_text (str, optional): A keyword or phrase to prioritize a specific link.
+
+    Returns:
+        str or None: The URL of the .xls file if found, otherwise None.
+    """
+    page_content = fetch_page(page_url)
+    if page_content is None:
+        return None
+    return extract_xls_link(page_content, page_url, reference_text)
+
+
 def is_valid_excel(content):
     """
     Validates whether the given content is a valid Excel file.
@@ -65,58 +142,135 @@ def is_valid_excel(content):
     Returns:
         bool: True if the content is a valid Excel file, False otherwise.
     """
+    # Only look at the signature, the file is fully parsed later on
+    return content[:len(XLS_MAGIC)] == XLS_MAGIC
+
+
+def load_download_index():
+    """
+    Loads the validators and local copies of previously downloaded files.
+
+    Returns:
+        dict: URL mapped to its "etag", "last_modified" and "path" entries, empty if there is no index yet.
+    """
     try:
-        with BytesIO(content) as data:
-            pd.ExcelFile(data) # Attempt to open the file as an Excel file
-        return True
-    except Exception:
-        return False
+        with open(DOWNLOAD_INDEX_PATH, encoding="utf-8") as index_file:
+            return json.load(index_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_file_atomically(path, content):
+    """
+    Writes a file next to its final path and swaps it in, so readers never see a partial file.
+
+    Parameters:
+        path (str): Final path of the file.
+        content (bytes): Binary content to write.
+    """
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "wb") as temp_file:
+            temp_file.write(content)
+        os.replace(temp_path, path)
+    finally:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+def save_download(url, content, etag, last_modified):
+    """
+    Keeps a local copy of a downloaded file and its validators for conditional requests.
+
+    Parameters:
+        url (str): URL the file was downloaded from.
+        content (bytes): Binary content of the file.
+        etag (str or None): ETag header of the response.
+        last_modified (str or None): Last-Modified header of the response.
+    """
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = os.path.join(CACHE_DIR, hashlib.sha256(url.encode()).hexdigest() + ".xls")
+    write_file_atomically(path, content)
+
+    index = load_download_index()
+    index[url] = {"etag": etag, "last_modified": last_modified, "path": path}
+    write_file_atomically(DOWNLOAD_INDEX_PATH, json.dumps(index).encode("utf-8"))
 
 
-def download_excel(url):
+def download_excel(url, conditional=True):
     """
-    Downloads an Excel file from a given URL.
+    Downloads an Excel file from a given URL, reusing the local copy if it did not change.
 
     Parameters:
         url (str): URL of the file to download.
+        conditional (bool, optional): Whether to ask the server to skip a file that did not change.
 
     Returns:
-        bytes or None: Binary content of the file if successfully downloaded, otherwise None.
+        bytes or None: Binary content of the file if successfully downloaded and it looks like
+        an Excel file, otherwise None.
     """
+    # Ask the server to skip the body if the file did not change since the last download
+    headers = dict(HEADERS)
+    cached = load_download_index().get(url) if conditional else None
+    if cached and not os.path.exists(cached["path"]):
+        cached = None
+    if cached:
+        if cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
     try:
-        # Send a GET request to the URL
-        response = requests.get(url)
-        response.raise_for_status()
-        return response.content
+        # Send a GET request to the URL and read the body in chunks
+        with _SESSION.get(url, headers=headers, timeout=30, stream=True) as response:
+            not_modified = response.status_code == 304 and cached
+            if not not_modified:
+                response.raise_for_status()
+                chunks = response.iter_content(chunk_size=64 * 1024)
+                first_chunk = next(chunks, b"")
+                # Stop before downloading the rest if it is not an Excel file
+                if not is_valid_excel(first_chunk):
+                    return None
+                content = bytearray(first_chunk)
+                for chunk in chunks:
+                    content.extend(chunk)
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
     except requests.exceptions.RequestException as e:
         #print(f"Error downloading file: {e}")
         return None
 
+    if not_modified:
+        try:
+            with open(cached["path"], "rb") as cached_file:
+                return cached_file.read()
+        except OSError:
+            # The local copy cannot be read, download the whole file instead
+            return download_excel(url, conditional=False)
 
-def create_empty_dataframe():
-    """
-    Creates an empty DataFrame with predefined column names.
-
-    Returns:
-        pd.DataFrame: An empty DataFrame with columns for date, region, product, unit, and price.
-    """
-    return pd.DataFrame(columns=["Date", "Region", "Product", "Unit", "Price"])
+    content = bytes(content)
+    if etag or last_modified:
+        try:
+            save_download(url, content, etag, last_modified)
+        except OSError:
+            # Keeping a local copy is optional, the download itself succeeded
+            pass
+    return content
 
 
-def find_sheet_case_insensitive(file_content, sheet_name):
+def find_sheet_case_insensitive(book, sheet_name):
     """
     Finds a sheet in an Excel file by name, case-insensitively.
 
     Parameters:
-        file_content (bytes): Binary content of the Excel file.
+        book (xlrd.book.Book): The already opened Excel file.
         sheet_name (str): The name of the sheet to find.
 
     Returns:
         str: The name of the matched sheet, or the first sheet if no match is found.
     """
-    with BytesIO(file_content) as file_data:
-        # Load all sheet names from the Excel file
-        sheets = pd.ExcelFile(file_data).sheet_names
+    sheets = book.sheet_names()
     for sheet in sheets:
         if sheet.lower() == sheet_name.lower():
             return sheet
@@ -126,132 +280,354 @@ def find_sheet_case_insensitive(file_content, sheet_name):
     return sheets[0]
 
 
-def populate_price_column_with_numbers(file_content, sheet_name, df):
+def read_sheet_values(file_content, sheet_name):
+    """
+    Reads the cells of a sheet from an .xls file, one row at a time.
+
+    Parameters:
+        file_content (bytes): Binary content of the Excel file.
+        sheet_name (str): The name of the sheet to read.
+
+    Returns:
+        tuple: Object array with numbers as floats, text as str and any other cell as None,
+        and a float array with the same shape holding only the numbers (NaN elsewhere).
+
+    Raises:
+        xlrd.XLRDError: If the content cannot be opened as a workbook or the sheet cannot be read.
+    """
+    # Load sheets on demand so only the requested one is parsed, and keep each
+    # row only up to its last used cell
+    book = None
+    try:
+        book = xlrd.open_workbook(file_contents=file_content, on_demand=True, ragged_rows=True)
+        actual_sheet_name = find_sheet_case_insensitive(book, sheet_name)
+        # The records of the sheet are only parsed here
+        sheet = book.sheet_by_name(actual_sheet_name)
+    except _CORRUPT_WORKBOOK_ERRORS as e:
+        if book is not None:
+            book.release_resources()
+        raise xlrd.XLRDError(f"Unreadable workbook: {e}") from e
+    try:
+        rows = []
+        for row_idx in range(sheet.nrows):
+            row_types = sheet.row_types(row_idx)
+            row_cells = zip(row_types, sheet.row_values(row_idx))
+            # Keep numbers and non-empty text, leave blanks, dates and errors as None
+            row = [
+                cell_value if cell_type == xlrd.XL_CELL_NUMBER or (cell_type == xlrd.XL_CELL_TEXT and cell_value) else None
+                for cell_type, cell_value in row_cells
+            ]
+            # Drop trailing empty cells and skip rows with nothing to read
+            while row and row[-1] is None:
+                row.pop()
+            if row:
+                number_cols = [col_idx for col_idx, cell_type in enumerate(row_types) if cell_type == xlrd.XL_CELL_NUMBER]
+                rows.append((row, number_cols))
+        values = np.full((len(rows), max((len(row) for row, _ in rows), default=0)), None, dtype=object)
+        numbers = np.full(values.shape, np.nan)
+        for row_idx, (row, number_cols) in enumerate(rows):
+            values[row_idx, :len(row)] = row
+            numbers[row_idx, number_cols] = values[row_idx, number_cols]
+    finally:
+        book.release_resources()
+    return values, numbers
+
+
+@functools.lru_cache(maxsize=8)
+def _year_regex(lang="es"):
+    """
+    Compiles the pattern of the year headers of a sheet language, once per language.
+
+    Parameters:
+        lang (str): Language of the sheet, a key of YEAR_WORDS.
+
+    Returns:
+        re.Pattern: Pattern capturing the four digits of the year.
+    """
+    return re.compile(rf"{re.escape(YEAR_WORDS[lang])} (\d{{4}})", re.IGNORECASE)
+
+
+def map_column_dates(values, lang="es"):
+    """
+    Finds the date (year and month) that applies to every column of a sheet.
+
+    Parameters:
+        values (numpy.ndarray): Object array with the cells of the sheet.
+        lang (str, optional): Language of the month names and year headers.
+
+    Returns:
+        dict: Column index mapped to a "YYYY-MM-01" string, or None if no date is found.
+    """
+    # Bind the lookups once before scanning
+    year_re = _year_regex(lang)
+    month_mapping = MONTH_MAPPINGS[lang]
+    year_prefix = YEAR_WORDS[lang] + " "
+    prefix_len = len(year_prefix)
+
+    column_dates = {}
+    # Only text cells can hold a month or a year
+    is_text = np.frompyfunc(lambda value: isinstance(value, str), 1, 1)
+    text_mask = is_text(values).astype(bool)
+    # Keep the last year found
+    last_year_found = None
+    for col_idx in range(values.shape[1]):
+        # Find months and years in the same column
+        date_found = None
+        year_found = None
+        for cell_value in values[text_mask[:, col_idx], col_idx]:
+            if cell_value in month_mapping:
+                date_found = month_mapping[cell_value]
+            elif cell_value[:prefix_len].lower() == year_prefix:
+                year_match = year_re.match(cell_value)
+                if year_match:
+                    year_found = year_match.group(1)
+                    # Update the last year found
+                    last_year_found = year_found
+            if date_found and year_found:
+                break
+        # Use the last year found if a current one is not found
+        if date_found and not year_found:
+            year_found = last_year_found
+
+        # Combine year and month if both are found
+        if date_found and year_found:
+            column_dates[col_idx] = f"{year_found}-{date_found}-01"
+        else:
+            column_dates[col_idx] = None
+    return column_dates
+
+
+def map_row_labels(values):
+    """
+    Finds the region, product and unit that apply to every row of a sheet.
+
+    Parameters:
+        values (numpy.ndarray): Object array with the cells of the sheet.
+
+    Returns:
+        dict: Row index mapped to a (region, product, unit) tuple.
+    """
+    # Keep the first three cells of every row apart for the fallback below
+    first_cells = np.full((values.shape[0], 3), None, dtype=object)
+    first_cells[:, :values.shape[1]] = values[:, :3]
+    first_cells = first_cells.tolist()
+
+    row_labels = {}
+    for row_idx, row in enumerate(values):
+        region_found = None
+        product_found = None
+        unit_found = None
+        for idx, check_value in enumerate(row):
+            if isinstance(check_value, str) and check_value in VALID_REGIONS:
+                region_found = check_value
+
+                # The first two str cells after the region are the product and the unit
+                next_strings = [next_value for next_value in row[idx + 1:] if isinstance(next_value, str)]
+                product_found = next_strings[0] if next_strings else None
+                unit_found = next_strings[1] if len(next_strings) > 1 else None
+                break
+
+        # If a valid region is not found, take the first cells in the row
+        if not region_found:
+            first_value, second_value, third_value = first_cells[row_idx]
+            region_found = first_value if isinstance(first_value, str) else None
+            #Take the second cell for the product
+            product_found = second_value if isinstance(second_value, str) else None
+            #Take the third cell for the units
+            unit_found = third_value if isinstance(third_value, str) else None
+
+        row_labels[row_idx] = (region_found, product_found, unit_found)
+    return row_labels
+
+
+def label_categories(labels, known_labels=()):
+    """
+    Builds the categories of a label column, always typed as objects.
+
+    Parameters:
+        labels (iterable): Labels found in the sheet, None or NaN where no label was found.
+        known_labels (iterable, optional): Labels to include even if they were not found.
+
+    Returns:
+        pd.Index: Sorted object index with the distinct labels, empty if there are none.
+    """
+    found_labels = {label for label in labels if isinstance(label, str)}
+    return pd.Index(sorted(found_labels.union(known_labels)), dtype=object)
+
+
+def populate_price_column_with_numbers(file_content, sheet_name, lang="es"):
     # Read the specified sheet from the file
-    with BytesIO(file_content) as file_data:
-        excel_data = pd.ExcelFile(file_data)
-        actual_sheet_name = find_sheet_case_insensitive(file_content, sheet_name)
-        sheet_data = pd.read_excel(excel_data, sheet_name=actual_sheet_name, header=None)
+    values, numbers = read_sheet_values(file_content, sheet_name)
         
     #define all lists
-    price_data = []
     region_data = []
     product_data = []
     unit_data = []
-    date_data = []
-    
-    # define region list
-    valid_regions = ["GBA", "Pampeana", "Noreste", "Noroeste", "Cuyo", "Patagonia"]
     
-    # Dictionary to convert months to numeric format
-    month_mapping = {
-        "Enero": "01", "Febrero": "02", "Marzo": "03", "Abril": "04",
-        "Mayo": "05", "Junio": "06", "Julio": "07", "Agosto": "08",
-        "Septiembre": "09", "Octubre": "10", "Noviembre": "11", "Diciembre": "12"
-    }
+    # Scan every column for its date and every row for its labels only once
+    column_dates = map_column_dates(values, lang)
+    row_labels = map_row_labels(values)
     
-    # Keep the last year found
-    last_year_found = None
-    
-    for col_idx, column_data in sheet_data.items():
-        for row_idx, value in enumerate(column_data):
-            #int and float values greater than 0
-            if isinstance(value, (int, float)) and value > 0: 
-                price_data.append(value)
-                # Find months and years in the same column
-                date_found = None
-                year_found = None
-                for cell_idx, cell_value in enumerate(column_data):
-                    if isinstance(cell_value, str):
-                        if cell_value in month_mapping:
-                            date_found = month_mapping[cell_value]
-                        elif re.match(r"(?i)año \d{4}", cell_value):
-                            year_found = re.search(r"\d{4}", cell_value).group()
-                            # Actualizar el último año encontrado
-                            last_year_found = year_found   
-                        if date_found and year_found:
-                            break
-                # Use the last year found if a current one is not found
-                if date_found and not year_found:
-                    year_found = last_year_found
-                    
-                # Combine year and month if both are found
-                if date_found and year_found:
-                    full_date = f"{year_found}-{date_found}-01"
-                else:
-                    full_date = None
-                    
-                # Find regions and products in the same row
-                row = sheet_data.iloc[row_idx]
-                region_found = None
-                product_found = None
-                for idx, check_value in enumerate(row):
-                     if isinstance(check_value, str) and check_value in valid_regions:
-                        region_found = check_value
-                        
-                        # Find the immediate str cell after the region for products
-                        for next_value in row[idx + 1:]:
-                            if isinstance(next_value, str):
-                                product_found = next_value
-                                break
-                        product_data.append(product_found)
-                        # Find the immediate str cell after the region for units
-                        for next_value in row[idx + 2:]:
-                            if isinstance(next_value, str):
-                                product_found = next_value
-                                break
-                        unit_data.append(product_found) 
-                        break
-                        
-                # If a valid region is not found, take the first cells in the row
-                if not region_found:
-                    region_found = row.iloc[0] if isinstance(row.iloc[0], str) else None
-                    #Take the second cell for the product
-                    product_found = row.iloc[1] if len(row) > 1 and isinstance(row.iloc[1], str) else None
-                    product_data.append(product_found)
-                    #Take the third cell for the units
-                    unit_found = row.iloc[2] if len(row) > 2 and isinstance(row.iloc[2], str) else None
-                    unit_data.append(product_found)   
-
-                date_data.append(full_date)
-                region_data.append(region_found)
+    #Numbers greater than 0, NaN marks the cells that are not numbers
+    mask = numbers > 0
+    # Walk the transposed mask so prices keep the column by column order
+    col_indexes, row_indexes = np.nonzero(mask.T)
+    price_data = np.round(numbers[row_indexes, col_indexes], 2)
+    for row_idx in row_indexes.tolist():
+        region_found, product_found, unit_found = row_labels[row_idx]
+        region_data.append(region_found)
+        product_data.append(product_found)
+        unit_data.append(unit_found)
                 
-    # Add the data to the columns 'Price', 'Region', 'Product','Unit', and 'Date'
-    if price_data:
-        df = df.reindex(range(len(price_data)))
-        df["Price"] = [round(price, 2) for price in price_data]
-        df["Region"] = region_data
-        df["Product"] = product_data
-        df["Unit"] = unit_data
-        df["Date"] = date_data
+    # Parse each column date once and spread it over the prices of that column
+    column_datetimes = pd.to_datetime(
+        [column_dates[col_idx] for col_idx in range(values.shape[1])],
+        format="%Y-%m-%d", cache=True, errors="coerce"
+    )
+    date_data = column_datetimes[col_indexes]
+
+    return build_price_dataframe(date_data, region_data, product_data, unit_data, price_data)
+
+
+def build_price_dataframe(date_data, region_data, product_data, unit_data, price_data):
+    """
+    Builds the price DataFrame with fixed column types, whatever the values are.
+
+    Parameters:
+        date_data (array-like): Date of every price, NaT where no date was found.
+        region_data (array-like): Region of every price.
+        product_data (array-like): Product of every price.
+        unit_data (array-like): Unit of every price.
+        price_data (array-like): The prices.
+
+    Returns:
+        pd.DataFrame: DataFrame with the columns 'Date', 'Region', 'Product', 'Unit', and 'Price'.
+    """
+    # Repeated labels are stored as categories, the known regions are always among them
+    df = pd.DataFrame({
+        # Pin the resolution so the column type does not depend on the parsed values
+        "Date": np.asarray(date_data, dtype="datetime64[ns]"),
+        "Region": pd.Categorical(region_data, categories=label_categories(region_data, VALID_REGIONS)),
+        "Product": pd.Categorical(product_data, categories=label_categories(product_data)),
+        "Unit": pd.Categorical(unit_data, categories=label_categories(unit_data)),
+        "Price": np.asarray(price_data, dtype=np.float32),
+    })
 
     return df
 
+def load_cached_prices(cache_path):
+    """
+    Reads parsed prices back from a Parquet cache file.
+
+    Parameters:
+        cache_path (str): Path of the cache file.
+
+    Returns:
+        pd.DataFrame or None: The prices with the same column types as a fresh parse, or None if
+        the file cannot be read.
+    """
+    try:
+        cached = pd.read_parquet(cache_path)
+    except (OSError, ValueError, TypeError, ImportError):
+        # An unreadable cache file is parsed again and replaced
+        return None
+    # Parquet does not keep the category types, so they are built again
+    return build_price_dataframe(
+        cached["Date"], cached["Region"], cached["Product"], cached["Unit"], cached["Price"]
+    )
+
+
+def save_cached_prices(df, cache_path):
+    """
+    Writes parsed prices to a Parquet cache file, skipping the cache if anything fails.
+
+    Parameters:
+        df (pd.DataFrame): The parsed prices.
+        cache_path (str): Path of the cache file.
+    """
+    # Write next to the final path and swap it in, so a killed run leaves no partial file
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        df.to_parquet(temp_path, index=False)
+        # Only keep the file if reading it back gives the same prices as the parse
+        if df.equals(load_cached_prices(temp_path)):
+            os.replace(temp_path, cache_path)
+    except (OSError, ValueError, TypeError, ImportError):
+        # The cache is only a shortcut, the parsed prices are still returned
+        pass
+    finally:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+def parse_download(content, sheet_name, lang="es"):
+    """
+    Parses a downloaded Excel file, reusing the cached result of an identical file.
+
+    Parameters:
+        content (bytes or None): Binary content of the downloaded file.
+        sheet_name (str): The name of the sheet to read.
+        lang (str, optional): Language of the month names and year headers.
+
+    Returns:
+        pd.DataFrame or None: The parsed prices, or None if the content is not a readable Excel file.
+    """
+    if content is None or not is_valid_excel(content):
+        return None
+
+    # Reuse the parsed data if this exact file was already processed the same way
+    content_hash = hashlib.sha256(content).hexdigest()
+    cache_name = f"{content_hash}-{sheet_name.lower()}-{lang}-v{PARSER_VERSION}.parquet"
+    cache_path = os.path.join(CACHE_DIR, cache_name)
+    if os.path.exists(cache_path):
+        df = load_cached_prices(cache_path)
+        if df is not None:
+            return df
+
+    try:
+        df = populate_price_column_with_numbers(content, sheet_name, lang)
+    except xlrd.XLRDError:
+        # The signature matched but the workbook itself could not be read
+        return None
+    save_cached_prices(df, cache_path)
+    return df
+
+
 def main():
     file_url = "https://www.indec.gob.ar/ftp/cuadros/economia/sh_ipc_precios_promedio.xls"
     fallback_url = "https://www.indec.gob.ar/Nivel4/Tema/3/5/31"
     reference_text = "Índice de precios al consumidor"
+    sheet_name = "Nacional"
+    lang = "es"
 
-    content = download_excel(file_url)
+    # Download the file and the fallback page at the same time
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        content_future = executor.submit(download_excel, file_url)
+        fallback_future = executor.submit(fetch_page, fallback_url)
+        content = content_future.result()
+        fallback_content = fallback_future.result()
     
-    # Check if the downloaded file is valid
-    if content is None or not is_valid_excel(content):
-        # Search for an alternative dynamic link in the fallback URL
-        dynamic_url = find_and_return_xls_link(fallback_url, reference_text)
+    # Parse the file, or fall back to the alternative link if it is not a readable Excel file
+    df = parse_download(content, sheet_name, lang)
+    if df is None:
+        # Search for an alternative dynamic link in the fallback page
+        dynamic_url = None
+        if fallback_content is not None:
+            dynamic_url = extract_xls_link(fallback_content, fallback_url, reference_text)
         if dynamic_url:
             # If a dynamic link is found, attempt to download the file
             content = download_excel(dynamic_url)
+            df = parse_download(content, sheet_name, lang)
             
         else:
             # If no alternative link is found, terminate the execution
             #print("No dynamic link to the file was found.")
             return
 
-    if content and is_valid_excel(content):
-        df = create_empty_dataframe()
-        df = populate_price_column_with_numbers(content, "Nacional", df)
-
-    else:
+    if df is None:
         print("The downloaded content is not a valid Excel file.")
         
 if __name__ == "__main__":